@@ -72,6 +72,12 @@ class BiggestTissueBoxMask(BinaryMask):
 
     """  # noqa
 
+    def __eq__(self, other: object) -> bool:
+        return type(self) is type(other)
+
+    def __hash__(self) -> int:
+        return hash(type(self))
+
     @lru_cache(maxsize=100)
     def _mask(self, slide) -> np.ndarray:
         """Return the thumbnail box mask containing the largest contiguous tissue area.
@@ -137,6 +143,12 @@ class TissueMask(BinaryMask):
     The tissue within the slide or tile is automatically detected through a predefined
     chain of filters."""
 
+    def __eq__(self, other: object) -> bool:
+        return type(self) is type(other)
+
+    def __hash__(self) -> int:
+        return hash(type(self))
+
     def __call__(self, obj: Union[Slide, Tile]) -> np.ndarray:
         """Apply a predefined chain of filters to calculate the tissue area mask.
 
@@ -30,7 +30,7 @@ from .exceptions import LevelError, SlidePropertyError
 from .filters.compositions import FiltersComposition
 from .tile import Tile
 from .types import CoordinatePair
-from .util import lazyproperty
+from .util import lazyproperty, resize_mask
 
 if TYPE_CHECKING:
     from .masks import BinaryMask
@@ -53,6 +53,14 @@ class Slide:
     ------
     TypeError
         If the processed path is not specified.
+
+    Notes
+    -----
+    Slides with the same ``path`` and ``processed_path`` are equal, and share the
+    values cached by their properties and by the binary masks computed from them.
+    These caches hold on to the slides and their thumbnails for the whole process, so
+    if the file at ``path`` is overwritten, the properties and masks computed before
+    are still returned for an equal slide.
     """
 
     def __init__(
@@ -70,6 +78,17 @@ class Slide:
             + f"(path={self._path}, processed_path={self._processed_path})"
         )
 
+    def __eq__(self, other: object) -> bool:
+        # Slides pointing to the same files are interchangeable. ``lazyproperty`` and
+        # ``BinaryMask._mask`` cache their values in lru_caches keyed on the slide, so
+        # equal slides share the cached values instead of computing them again.
+        if not isinstance(other, Slide):
+            return NotImplemented
+        return self._key == other._key
+
+    def __hash__(self) -> int:
+        return hash(self._key)
+
     # ---public interface methods and properties---
 
     @lazyproperty
@@ -240,9 +259,7 @@ class Slide:
         """
         img = self.scaled_image(scale_factor)
         mask = binary_mask(self)
-        resized_mask = np.array(
-            PIL.Image.fromarray(mask).resize(img.size, PIL.Image.ANTIALIAS)
-        )
+        resized_mask = resize_mask(mask, img.size)
 
         if tissue_mask:
             filters = FiltersComposition(Slide).tissue_mask_filters
@@ -351,6 +368,17 @@ class Slide:
 
     # ------- implementation helpers -------
 
+    @property
+    def _key(self) -> Tuple[str, str]:
+        """Value identifying the slide, used for equality and hashing.
+
+        Returns
+        -------
+        Tuple[str, str]
+            Path of the WSI and path where the tiles will be saved to.
+        """
+        return self._path, str(self._processed_path)
+
     def _has_valid_coords(self, coords: CoordinatePair) -> bool:
         """Check if ``coords`` are valid 0-level coordinates.
 
@@ -147,7 +147,8 @@ class Tile:
 
         The format to use is determined from the filename extension (to be compatible to
         PIL.Image formats). If no extension is provided, the image will be saved in png
-        format.
+        format. With the ``.npy`` extension, the pixels of the image are saved as a raw
+        NumPy array, without any encoding.
 
         Parameters
         ---------
@@ -160,7 +161,10 @@ class Tile:
             path = f"{path}.png"
 
         Path(path).parent.mkdir(parents=True, exist_ok=True)
-        self._image.save(path)
+        if ext == ".npy":
+            np.save(path, np.asarray(self._image))
+        else:
+            self._image.save(path)
 
     @lazyproperty
     def tissue_ratio(self) -> float:
@@ -213,7 +217,10 @@ class Tile:
         """
 
         filters = FiltersComposition(Tile).tissue_mask_filters
-        return np.mean(filters(self._image)) * 100 > tissue_percent
+        tissue_mask = filters(self._image)
+        # Counting the True pixels avoids the float64 copy of the mask done by np.mean
+        tissue_pixels = np.count_nonzero(tissue_mask)
+        return tissue_pixels * 100 > tissue_percent * np.size(tissue_mask)
 
     @lazyproperty
     def _is_almost_white(self) -> bool:
@@ -16,12 +16,17 @@
 # limitations under the License.
 # ------------------------------------------------------------------------
 
+import copy
 import csv
 import logging
+import multiprocessing
 import os
 from abc import abstractmethod
-from itertools import zip_longest
-from typing import Iterable, List, Optional, Tuple, Union
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import lru_cache
+from itertools import chain, zip_longest
+from typing import Iterable, Iterator, List, Optional, Tuple, Union
 
 import numpy as np
 import PIL
@@ -33,7 +38,6 @@ from .slide import Slide
 from .tile import Tile
 from .types import CoordinatePair
 from .util import (
-    random_choice_true_mask2d,
     rectangle_to_mask,
     region_coordinates,
     regions_from_binary_mask,
@@ -350,8 +354,8 @@ class GridTiler(Tiler):
             tile_filename = self._tile_filename(tile_wsi_coords, tiles_counter)
             full_tile_path = os.path.join(slide.processed_path, tile_filename)
             tile.save(full_tile_path)
-            logger.info(f"\t Tile {tiles_counter} saved: {tile_filename}")
-        logger.info(f"{tiles_counter} Grid Tiles have been saved.")
+            logger.debug("\t Tile %d saved: %s", tiles_counter, tile_filename)
+        logger.info("%d Grid Tiles have been saved.", tiles_counter)
 
     @property
     def tile_size(self) -> Tuple[int, int]:
@@ -584,10 +588,13 @@ class RandomTiler(Tiler):
     level : int, optional
         Level from which extract the tiles. Default is 0.
     seed : int, optional
-        Seed for RandomState. Must be convertible to 32 bit unsigned integers. Default
-        is 7.
+        Seed for the random Generator. Must be convertible to 32 bit unsigned integers.
+        Default is 7.
     check_tissue : bool, optional
-        Whether to check if the tile has enough tissue to be saved. Default is True.
+        Whether to check if the tile has enough tissue to be saved. If True, the tiles
+        which do not have more than ``tissue_percent`` of their area within the
+        extraction mask are discarded before being read from the slide. Default is
+        True.
     tissue_percent : float, optional
         Number between 0.0 and 100.0 representing the minimum required percentage of
         tissue over the total area of the image, default is 80.0. This is considered
@@ -599,6 +606,16 @@ class RandomTiler(Tiler):
     max_iter : int, optional
         Maximum number of iterations performed when searching for eligible (if
         ``check_tissue=True``) tiles. Must be grater than or equal to ``n_tiles``.
+        Every random tile drawn counts as an iteration, including the ones discarded
+        before being read because they are not within the extraction mask: on sparse
+        masks, the same ``max_iter`` may yield fewer tiles than when only the tiles
+        read from the slide were counted.
+    fast_write : bool, optional
+        Whether to save the tiles as uncompressed TIFF images instead of PNG images,
+        i.e. to use the '.tiff' suffix if ``suffix`` is '.png'. This skips the PNG
+        encoding, which is the most expensive step of saving a tile, at the cost of
+        files about 5 times larger. The '.npy' suffix, saving the raw pixels as NumPy
+        arrays, is also available regardless of this option. Default is False.
     """
 
     def __init__(
@@ -612,6 +629,7 @@ class RandomTiler(Tiler):
         prefix: str = "",
         suffix: str = ".png",
         max_iter: int = int(1e4),
+        fast_write: bool = False,
     ):
         self.tile_size = tile_size
         self.n_tiles = n_tiles
@@ -621,13 +639,16 @@ class RandomTiler(Tiler):
         self.check_tissue = check_tissue
         self.tissue_percent = tissue_percent
         self.prefix = prefix
-        self.suffix = suffix
+        # Pillow writes TIFF images without any compression by default
+        self.suffix = ".tiff" if fast_write and suffix == ".png" else suffix
+        self.fast_write = fast_write
 
     def extract(
         self,
         slide: Slide,
         extraction_mask: BinaryMask = BiggestTissueBoxMask(),
         log_level: str = "INFO",
+        n_workers: Optional[int] = 1,
     ) -> None:
         """Extract random tiles and save them to disk, following this filename pattern:
         `{prefix}tile_{tiles_counter}_level{level}_{x_ul_wsi}-{y_ul_wsi}-{x_br_wsi}-{y_br_wsi}{suffix}`
@@ -641,6 +662,17 @@ class RandomTiler(Tiler):
             Default `BiggestTissueBoxMask`.
         log_level: str, {"DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"}
             Threshold level for the log messages. Default "INFO"
+        n_workers : int, optional
+            Number of processes extracting the tiles. The ``n_tiles`` and ``max_iter``
+            budgets are split among the processes, each one opening the slide on its
+            own and drawing its tiles with seed ``seed + <process index>``. Hence, the
+            tiles extracted by more than one process differ from the ones extracted by
+            a single process. If None, a process per available CPU is used. Default
+            is 1. With more than one process, the processes are spawned: ``slide`` and
+            ``extraction_mask`` must be picklable, as they are sent to every process,
+            and a script calling ``extract`` must do it under an
+            ``if __name__ == "__main__":`` guard, since every process imports the
+            script again.
 
         Raises
         ------
@@ -654,15 +686,53 @@ class RandomTiler(Tiler):
         self._validate_level(slide)
         self._validate_tile_size(slide)
 
-        random_tiles = self._tiles_generator(slide, extraction_mask)
+        available_cpus = self._available_cpus()
+        if n_workers is None:
+            n_workers = available_cpus
 
-        tiles_counter = 0
-        for tiles_counter, (tile, tile_wsi_coords) in enumerate(random_tiles):
-            tile_filename = self._tile_filename(tile_wsi_coords, tiles_counter)
-            full_tile_path = os.path.join(slide.processed_path, tile_filename)
-            tile.save(full_tile_path)
-            logger.info(f"\t Tile {tiles_counter} saved: {tile_filename}")
-        logger.info(f"{tiles_counter+1} Random Tiles have been saved.")
+        # The mask and the tables to draw the tiles from are computed only once, here,
+        # and shared with the processes extracting the tiles
+        binary_mask = extraction_mask(slide)
+        mask_true_idx, mask_integral = self._mask_sampling_tables(
+            binary_mask, self.check_tissue
+        )
+
+        if n_workers <= 1 or self.n_tiles <= 1:
+            saved_tiles = self._save_tiles(
+                slide, binary_mask, mask_true_idx, mask_integral, 0, available_cpus
+            )
+        else:
+            shards = self._shards(n_workers)
+            max_threads = max(available_cpus // len(shards), 1)
+            # Spawned processes do not inherit the slide handles opened by this one,
+            # which are not safe to use after a fork on all the platforms
+            context = multiprocessing.get_context("spawn")
+            with context.Pool(len(shards)) as pool:
+                saved_tiles = chain.from_iterable(
+                    pool.starmap(
+                        RandomTiler._extract_shard,
+                        [
+                            (
+                                shard,
+                                slide,
+                                binary_mask,
+                                mask_true_idx,
+                                mask_integral,
+                                start_idx,
+                                max_threads,
+                            )
+                            for shard, start_idx in shards
+                        ],
+                    )
+                )
+
+        # The tiles saved by other processes are logged here, since the processes do
+        # not inherit the logging configuration of this one
+        n_saved_tiles = 0
+        for tiles_counter, tile_filename in saved_tiles:
+            logger.debug("\t Tile %d saved: %s", tiles_counter, tile_filename)
+            n_saved_tiles += 1
+        logger.info("%d Random Tiles have been saved.", n_saved_tiles)
 
     @property
     def max_iter(self) -> int:
@@ -689,47 +759,503 @@ class RandomTiler(Tiler):
 
     # ------- implementation helpers -------
 
-    def _random_tile_coordinates(
-        self, slide: Slide, extraction_mask: BinaryMask = BiggestTissueBoxMask()
-    ) -> CoordinatePair:
-        """Return 0-level Coordinates of a tile picked at random within the box.
+    @staticmethod
+    def _available_cpus() -> int:
+        """Return the number of CPUs available to the current process.
+
+        Returns
+        -------
+        int
+            Number of CPUs the current process is allowed to run on.
+        """
+        try:
+            return len(os.sched_getaffinity(0))
+        except AttributeError:  # pragma: no cover
+            # ``os.sched_getaffinity`` is not available on all the platforms
+            return os.cpu_count() or 1
+
+    def _extract_shard(
+        self,
+        slide: Slide,
+        binary_mask: np.ndarray,
+        mask_true_idx: Optional[np.ndarray],
+        mask_integral: Optional[np.ndarray],
+        start_idx: int,
+        max_threads: int,
+    ) -> List[Tuple[int, str]]:
+        """Extract random tiles and save them to disk, counting them from ``start_idx``.
 
         Parameters
         ----------
         slide : Slide
-            Slide from which calculate the coordinates. Needed to calculate the box.
-        extraction_mask : BinaryMask, optional
-            BinaryMask object defining how to compute a binary mask from a Slide.
-            Default `BiggestTissueBoxMask`.
+            Slide from which to extract the tiles
+        binary_mask : np.ndarray
+            Binary mask computed from the extraction mask of the slide.
+        mask_true_idx : Optional[np.ndarray]
+            Indices of the flattened ``binary_mask`` where it is True, or None if
+            ``binary_mask`` is True everywhere.
+        mask_integral : Optional[np.ndarray]
+            Summed-area table of ``binary_mask``, padded with a leading row and column
+            of zeros. None to keep the tiles which are not within the extraction mask.
+        start_idx : int
+            Counter of the first saved tile, used in the tile filenames.
+        max_threads : int
+            Number of threads saving the tiles.
 
         Returns
         -------
-        CoordinatePair
-            Random tile Coordinates at level 0
+        List[Tuple[int, str]]
+            Counter and filename of the saved tiles.
         """
-        binary_mask = extraction_mask(slide)
-        tile_w_lvl, tile_h_lvl = self.tile_size
+        return list(
+            self._save_tiles(
+                slide, binary_mask, mask_true_idx, mask_integral, start_idx, max_threads
+            )
+        )
+
+    def _save_tiles(
+        self,
+        slide: Slide,
+        binary_mask: np.ndarray,
+        mask_true_idx: Optional[np.ndarray],
+        mask_integral: Optional[np.ndarray],
+        start_idx: int,
+        max_threads: int,
+    ) -> Iterator[Tuple[int, str]]:
+        """Save random tiles to disk, counting them from ``start_idx``.
+
+        Parameters
+        ----------
+        slide : Slide
+            Slide from which to extract the tiles
+        binary_mask : np.ndarray
+            Binary mask computed from the extraction mask of the slide.
+        mask_true_idx : Optional[np.ndarray]
+            Indices of the flattened ``binary_mask`` where it is True, or None if
+            ``binary_mask`` is True everywhere.
+        mask_integral : Optional[np.ndarray]
+            Summed-area table of ``binary_mask``, padded with a leading row and column
+            of zeros. None to keep the tiles which are not within the extraction mask.
+        start_idx : int
+            Counter of the first saved tile, used in the tile filenames.
+        max_threads : int
+            Number of threads saving the tiles.
+
+        Yields
+        ------
+        tiles_counter : int
+            Counter of the saved tile.
+        tile_filename : str
+            Filename of the saved tile.
+        """
+        random_tiles = self._random_tiles(
+            slide, binary_mask, mask_true_idx, mask_integral
+        )
+
+        # Tiles are encoded and written to disk by a pool of threads while the next
+        # ones are read from the slide. At most ``2 * max_threads`` tiles are kept in
+        # memory, and they are reported in the same order they were extracted.
+        pending_saves = deque()
+        with ThreadPoolExecutor(max_workers=max_threads) as executor:
+            for tiles_counter, (tile, tile_wsi_coords) in enumerate(
+                random_tiles, start_idx
+            ):
+                tile_filename = self._tile_filename(tile_wsi_coords, tiles_counter)
+                full_tile_path = os.path.join(slide.processed_path, tile_filename)
+                future = executor.submit(tile.save, full_tile_path)
+                pending_saves.append((tiles_counter, tile_filename, future))
+                if len(pending_saves) >= 2 * max_threads:
+                    yield self._wait_tile_saved(*pending_saves.popleft())
+            while pending_saves:
+                yield self._wait_tile_saved(*pending_saves.popleft())
+
+    def _shards(self, n_workers: int) -> List[Tuple["RandomTiler", int]]:
+        """Split the extraction among ``n_workers`` random tilers.
+
+        ``n_tiles`` and ``max_iter`` are split as evenly as possible, each tiler is
+        seeded with ``seed + <shard index>`` and numbers its tiles from the first
+        counter not used by the previous tilers, so that their filenames never clash.
+
+        Parameters
+        ----------
+        n_workers : int
+            Number of shards. It is reduced to ``n_tiles`` if greater.
+
+        Returns
+        -------
+        List[Tuple[RandomTiler, int]]
+            Random tiler of each shard, with the counter of its first tile.
+        """
+        n_shards = max(min(n_workers, self.n_tiles), 1)
+        shards = []
+        start_idx = 0
+        for shard_idx in range(n_shards):
+            shard = copy.copy(self)
+            shard.n_tiles = len(range(shard_idx, self.n_tiles, n_shards))
+            shard.max_iter = len(range(shard_idx, self.max_iter, n_shards))
+            shard.seed = (self.seed + shard_idx) % 2**32
+            shards.append((shard, start_idx))
+            start_idx += shard.n_tiles
+        return shards
+
+    @staticmethod
+    def _wait_tile_saved(
+        tiles_counter: int, tile_filename: str, future: Future
+    ) -> Tuple[int, str]:
+        """Wait for a tile to be saved to disk.
+
+        Parameters
+        ----------
+        tiles_counter : int
+            Counter of the saved tile.
+        tile_filename : str
+            Filename of the saved tile.
+        future : Future
+            Future of the ``Tile.save`` call.
+
+        Returns
+        -------
+        Tuple[int, str]
+            Counter and filename of the saved tile.
+
+        Raises
+        ------
+        Exception
+            Any exception raised while saving the tile.
+        """
+        future.result()
+        return tiles_counter, tile_filename
+
+    def _draw_coord_batch(
+        self,
+        binary_mask: np.ndarray,
+        mask_true_idx: Optional[np.ndarray],
+        batch_size: int,
+        rng: np.random.Generator,
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Return a batch of random (column, row) locations where the mask is True.
+
+        Parameters
+        ----------
+        binary_mask : np.ndarray
+            Binary mask computed from the extraction mask of the slide.
+        mask_true_idx : Optional[np.ndarray]
+            Indices of the flattened ``binary_mask`` where it is True, as returned by
+            ``np.flatnonzero``. None means that ``binary_mask`` is True everywhere, so
+            the locations are drawn directly from its shape.
+        batch_size : int
+            Number of locations to draw.
+        rng : np.random.Generator
+            Random Generator drawing the locations.
+
+        Returns
+        -------
+        Tuple[np.ndarray, np.ndarray]
+            Columns and rows of the random locations, in the extraction mask space.
+        """
+        if mask_true_idx is None:
+            xs = rng.integers(binary_mask.shape[1], size=batch_size)
+            ys = rng.integers(binary_mask.shape[0], size=batch_size)
+            return xs, ys
+
+        idx = rng.integers(mask_true_idx.size, size=batch_size)
+        ys, xs = np.divmod(mask_true_idx[idx], binary_mask.shape[1])
+        return xs, ys
+
+    @staticmethod
+    def _mask_true_idx(binary_mask: np.ndarray) -> Optional[np.ndarray]:
+        """Return the indices of the flattened ``binary_mask`` where it is True.
+
+        The indices are stored with the smallest unsigned integer type able to address
+        the mask (4 bytes for thumbnail-sized masks instead of the 8 bytes of
+        ``np.intp``), since they are kept in memory for the whole extraction.
+
+        Parameters
+        ----------
+        binary_mask : np.ndarray
+            Binary mask computed from the extraction mask of the slide.
+
+        Returns
+        -------
+        Optional[np.ndarray]
+            Indices of the flattened ``binary_mask`` where it is True, or None if
+            ``binary_mask`` is True everywhere.
+        """
+        # The True locations of the mask are invariant: scan the mask only once, and
+        # skip materializing them at all when the mask is True everywhere
+        if binary_mask.all():
+            return None
+        idx_dtype = np.min_scalar_type(binary_mask.size)
+        return np.flatnonzero(binary_mask).astype(idx_dtype, copy=False)
+
+    @staticmethod
+    def _mask_integral(binary_mask: np.ndarray) -> np.ndarray:
+        """Return the summed-area table of ``binary_mask``.
 
-        x_ul_lvl, y_ul_lvl = random_choice_true_mask2d(binary_mask)
+        As the indices of ``_mask_true_idx``, the sums are stored with the smallest
+        unsigned integer type able to count all the pixels of the mask.
 
-        # Scale tile dimensions to extraction mask dimensions
-        tile_w_thumb = (
-            tile_w_lvl * binary_mask.shape[1] / slide.level_dimensions(self.level)[0]
+        Parameters
+        ----------
+        binary_mask : np.ndarray
+            Binary mask computed from the extraction mask of the slide.
+
+        Returns
+        -------
+        np.ndarray
+            Summed-area table of ``binary_mask``, padded with a leading row and column
+            of zeros.
+        """
+        sum_dtype = np.min_scalar_type(binary_mask.size)
+        mask_integral = binary_mask.cumsum(axis=0, dtype=sum_dtype)
+        mask_integral.cumsum(axis=1, out=mask_integral)
+        return np.pad(mask_integral, ((1, 0), (1, 0)))
+
+    @staticmethod
+    def _mask_sampling_tables(
+        binary_mask: np.ndarray, check_tissue: bool
+    ) -> Tuple[Optional[np.ndarray], Optional[np.ndarray]]:
+        """Return the tables used to draw random tiles within ``binary_mask``.
+
+        The tables only depend on the content of the binary mask, so they are cached
+        on it across all the ``RandomTiler`` objects extracting tiles from the same
+        mask, e.g. when sweeping ``n_tiles`` or ``tile_size``. A mask whose content
+        changes gets new tables, whatever the extraction mask computing it.
+
+        Parameters
+        ----------
+        binary_mask : np.ndarray
+            Binary mask computed from the extraction mask of the slide.
+        check_tissue : bool
+            Whether the summed-area table of the mask is needed.
+
+        Returns
+        -------
+        mask_true_idx : Optional[np.ndarray]
+            Indices of the flattened binary mask where it is True, or None if the mask
+            is True everywhere.
+        mask_integral : Optional[np.ndarray]
+            Summed-area table of the binary mask, or None if ``check_tissue`` is False.
+        """
+        binary_mask = np.asarray(binary_mask, dtype=bool)
+        return RandomTiler._cached_mask_sampling_tables(
+            binary_mask.tobytes(), binary_mask.shape, check_tissue
         )
-        tile_h_thumb = (
-            tile_h_lvl * binary_mask.shape[0] / slide.level_dimensions(self.level)[1]
+
+    @staticmethod
+    @lru_cache(maxsize=4)
+    def _cached_mask_sampling_tables(
+        mask_bytes: bytes, mask_shape: Tuple[int, int], check_tissue: bool
+    ) -> Tuple[Optional[np.ndarray], Optional[np.ndarray]]:
+        """Return the tables used to draw random tiles within a binary mask.
+
+        Parameters
+        ----------
+        mask_bytes : bytes
+            Raw bytes of the boolean binary mask.
+        mask_shape : Tuple[int, int]
+            Shape of the binary mask.
+        check_tissue : bool
+            Whether the summed-area table of the mask is needed.
+
+        Returns
+        -------
+        mask_true_idx : Optional[np.ndarray]
+            Indices of the flattened binary mask where it is True, or None if the mask
+            is True everywhere.
+        mask_integral : Optional[np.ndarray]
+            Summed-area table of the binary mask, or None if ``check_tissue`` is False.
+        """
+        binary_mask = np.frombuffer(mask_bytes, dtype=bool).reshape(mask_shape)
+        mask_true_idx = RandomTiler._mask_true_idx(binary_mask)
+        mask_integral = (
+            RandomTiler._mask_integral(binary_mask) if check_tissue else None
         )
+        return mask_true_idx, mask_integral
+
+    def _random_tiles_wsi_coordinates(
+        self,
+        binary_mask: np.ndarray,
+        mask_true_idx: Optional[np.ndarray],
+        mask_integral: Optional[np.ndarray],
+        tile_size_mask: Tuple[float, float],
+        wsi_size: Tuple[int, int],
+        rng: np.random.Generator,
+    ) -> Iterator[np.ndarray]:
+        """Generate 0-level coordinates of tiles picked at random within the mask.
+
+        The upper left corners of the tiles are drawn where ``binary_mask`` is True, in
+        batches, to amortize the cost of the random draws and of the scaling over many
+        candidate tiles. If ``mask_integral`` is given, the tiles which are not within
+        the extraction mask are discarded in the same batch, so that only the
+        candidates worth reading from the slide reach the Python loop. At most
+        ``max_iter`` candidates are drawn, whether they are discarded or not.
+
+        Parameters
+        ----------
+        binary_mask : np.ndarray
+            Binary mask computed from the extraction mask of the slide.
+        mask_true_idx : Optional[np.ndarray]
+            Indices of the flattened ``binary_mask`` where it is True, or None if
+            ``binary_mask`` is True everywhere.
+        mask_integral : Optional[np.ndarray]
+            Summed-area table of ``binary_mask``, padded with a leading row and column
+            of zeros. None to keep the tiles which are not within the extraction mask.
+        tile_size_mask : Tuple[float, float]
+            (width, height) of the tiles in the extraction mask space.
+        wsi_size : Tuple[int, int]
+            (width, height) of the slide at level 0.
+        rng : np.random.Generator
+            Random Generator drawing the upper left corners of the tiles.
 
-        x_br_lvl = x_ul_lvl + tile_w_thumb
-        y_br_lvl = y_ul_lvl + tile_h_thumb
+        Yields
+        ------
+        np.ndarray
+            ``(x_ul, y_ul, x_br, y_br)`` coordinates of a random tile at level 0.
+        """
+        mask_size = binary_mask.shape[::-1]
+        batch_size = max(min(self.n_tiles * 4, self.max_iter), 1)
+
+        n_drawn = 0
+        while n_drawn < self.max_iter:
+            batch_size = min(batch_size, self.max_iter - n_drawn)
+            xs, ys = self._draw_coord_batch(binary_mask, mask_true_idx, batch_size, rng)
+            n_drawn += batch_size
+
+            if mask_integral is not None:
+                are_within_mask = self._are_within_extraction_mask(
+                    xs, ys, tile_size_mask, mask_integral, self.tissue_percent
+                )
+                xs, ys = xs[are_within_mask], ys[are_within_mask]
 
-        tile_wsi_coords = scale_coordinates(
-            reference_coords=CoordinatePair(x_ul_lvl, y_ul_lvl, x_br_lvl, y_br_lvl),
-            reference_size=binary_mask.shape[::-1],
-            target_size=slide.dimensions,
+            yield from self._tiles_wsi_coordinates(
+                xs, ys, tile_size_mask, mask_size, wsi_size
+            )
+
+    @staticmethod
+    def _are_within_extraction_mask(
+        xs: np.ndarray,
+        ys: np.ndarray,
+        tile_size_mask: Tuple[float, float],
+        mask_integral: np.ndarray,
+        tissue_percent: float,
+    ) -> np.ndarray:
+        """Check which tiles are within the extraction mask.
+
+        A tile is within the extraction mask if more than ``tissue_percent`` of its
+        area is inside of the mask, as a tile with less of its area in the mask can
+        hardly have enough tissue. The tiles overflowing the mask are shifted inside
+        of it, as done for their coordinates at level 0. The area of all the tiles is
+        computed at once from the summed-area table of the mask.
+
+        Parameters
+        ----------
+        xs : np.ndarray
+            Columns of the upper left corners of the tiles, in the extraction mask
+            space.
+        ys : np.ndarray
+            Rows of the upper left corners of the tiles, in the extraction mask space.
+        tile_size_mask : Tuple[float, float]
+            (width, height) of the tiles in the extraction mask space.
+        mask_integral : np.ndarray
+            Summed-area table of the extraction mask, padded with a leading row and
+            column of zeros.
+        tissue_percent : float
+            Minimum required percentage of tissue over the total area of the tiles.
+
+        Returns
+        -------
+        np.ndarray
+            Boolean array, True for the tiles within the extraction mask.
+        """
+        mask_h, mask_w = mask_integral.shape[0] - 1, mask_integral.shape[1] - 1
+        tile_w = min(max(int(np.ceil(tile_size_mask[0])), 1), mask_w)
+        tile_h = min(max(int(np.ceil(tile_size_mask[1])), 1), mask_h)
+
+        x_ul = np.minimum(xs.astype(np.intp), mask_w - tile_w)
+        y_ul = np.minimum(ys.astype(np.intp), mask_h - tile_h)
+        x_br = x_ul + tile_w
+        y_br = y_ul + tile_h
+
+        # The unsigned sums may wrap around in between, but not the area of the tiles
+        tile_in_mask_area = (
+            mask_integral[y_br, x_br]
+            - mask_integral[y_ul, x_br]
+            - mask_integral[y_br, x_ul]
+            + mask_integral[y_ul, x_ul]
+        ).astype(np.intp)
+        return tile_in_mask_area * 100 > tissue_percent * tile_w * tile_h
+
+    def _tile_size_mask(
+        self, slide: Slide, binary_mask: np.ndarray
+    ) -> Tuple[float, float]:
+        """Return the tile size scaled to the extraction mask dimensions.
+
+        Parameters
+        ----------
+        slide : Slide
+            Slide from which to extract the tiles.
+        binary_mask : np.ndarray
+            Binary mask computed from the extraction mask of the slide.
+
+        Returns
+        -------
+        Tuple[float, float]
+            (width, height) of the tiles in the extraction mask space.
+        """
+        tile_w_lvl, tile_h_lvl = self.tile_size
+        slide_w_lvl, slide_h_lvl = slide.level_dimensions(self.level)
+        return (
+            tile_w_lvl * binary_mask.shape[1] / slide_w_lvl,
+            tile_h_lvl * binary_mask.shape[0] / slide_h_lvl,
         )
 
-        return tile_wsi_coords
+    @staticmethod
+    def _tiles_wsi_coordinates(
+        xs: np.ndarray,
+        ys: np.ndarray,
+        tile_size_mask: Tuple[float, float],
+        mask_size: Tuple[int, int],
+        wsi_size: Tuple[int, int],
+    ) -> np.ndarray:
+        """Return 0-level coordinates of the tiles with the given upper left corners.
+
+        The scaling is the same as ``scale_coordinates``, applied to all the tiles at
+        once. Tiles overflowing the right or bottom border of the slide are shifted
+        back inside of it, so that the returned coordinates can always be extracted.
+
+        Parameters
+        ----------
+        xs : np.ndarray
+            Columns of the upper left corners of the tiles, in the extraction mask
+            space.
+        ys : np.ndarray
+            Rows of the upper left corners of the tiles, in the extraction mask space.
+        tile_size_mask : Tuple[float, float]
+            (width, height) of the tiles in the extraction mask space.
+        mask_size : Tuple[int, int]
+            (width, height) of the extraction mask.
+        wsi_size : Tuple[int, int]
+            (width, height) of the slide at level 0.
+
+        Returns
+        -------
+        np.ndarray
+            Array of shape (n_tiles, 4) with the ``(x_ul, y_ul, x_br, y_br)``
+            coordinates of each tile at level 0.
+        """
+        tile_w_mask, tile_h_mask = tile_size_mask
+        tiles_mask_coords = np.column_stack(
+            (xs, ys, xs + tile_w_mask, ys + tile_h_mask)
+        ).astype(np.float64)
+
+        tiles_wsi_coords = np.floor(
+            (tiles_mask_coords * np.tile(wsi_size, 2)) / np.tile(mask_size, 2)
+        ).astype("int64")
+
+        overflow = np.maximum(tiles_wsi_coords[:, 2:] - np.asarray(wsi_size) + 1, 0)
+        tiles_wsi_coords -= np.tile(overflow, 2)
+        return tiles_wsi_coords
 
     def _tiles_generator(
         self, slide: Slide, extraction_mask: BinaryMask = BiggestTissueBoxMask()
@@ -755,27 +1281,76 @@ class RandomTiler(Tiler):
         coords : CoordinatePair
             The level-0 coordinates of the extracted tile
         """
-        np.random.seed(self.seed)
-        iteration = valid_tile_counter = 0
+        binary_mask = extraction_mask(slide)
+        mask_true_idx, mask_integral = self._mask_sampling_tables(
+            binary_mask, self.check_tissue
+        )
+        yield from self._random_tiles(slide, binary_mask, mask_true_idx, mask_integral)
+
+    def _random_tiles(
+        self,
+        slide: Slide,
+        binary_mask: np.ndarray,
+        mask_true_idx: Optional[np.ndarray],
+        mask_integral: Optional[np.ndarray],
+    ) -> Iterator[Tuple[Tile, CoordinatePair]]:
+        """Generate Random Tiles within the binary mask of a slide.
 
-        while True:
-            tile_wsi_coords = self._random_tile_coordinates(slide, extraction_mask)
+        Parameters
+        ----------
+        slide : Slide
+            The Whole Slide Image from which to extract the tiles.
+        binary_mask : np.ndarray
+            Binary mask computed from the extraction mask of the slide.
+        mask_true_idx : Optional[np.ndarray]
+            Indices of the flattened ``binary_mask`` where it is True, or None if
+            ``binary_mask`` is True everywhere.
+        mask_integral : Optional[np.ndarray]
+            Summed-area table of ``binary_mask``, padded with a leading row and column
+            of zeros. None to keep the tiles which are not within the extraction mask.
+
+        Yields
+        ------
+        tile : Tile
+            The extracted Tile
+        coords : CoordinatePair
+            The level-0 coordinates of the extracted tile
+        """
+        if not 0 <= self.seed < 2**32:
+            raise ValueError("Seed must be between 0 and 2**32 - 1")
+        if self.n_tiles == 0:
+            return
+        # Start over from the seed at each run, so that the same tiles are drawn by
+        # ``locate_tiles`` and ``extract``, without touching the global NumPy state
+        rng = np.random.default_rng(self.seed)
+        valid_tile_counter = 0
+
+        tile_size_mask = self._tile_size_mask(slide, binary_mask)
+        # The candidates are drawn and discarded ``max_iter`` at most in NumPy, the
+        # loop only reads and checks the tiles worth reading
+        random_tiles_wsi_coords = self._random_tiles_wsi_coordinates(
+            binary_mask,
+            mask_true_idx,
+            mask_integral,
+            tile_size_mask,
+            slide.dimensions,
+            rng,
+        )
+
+        for tile_wsi_coords in random_tiles_wsi_coords:
+            if valid_tile_counter >= self.n_tiles:
+                break
+
+            tile_wsi_coords = CoordinatePair(*tile_wsi_coords.tolist())
             try:
                 tile = slide.extract_tile(tile_wsi_coords, self.level, self.tile_size)
             except ValueError:
-                iteration -= 1
+                # Only possible when the tile is as large as the slide
                 continue
 
             if not self.check_tissue or tile.has_enough_tissue(self.tissue_percent):
                 yield tile, tile_wsi_coords
                 valid_tile_counter += 1
-            iteration += 1
-
-            if self.max_iter and iteration >= self.max_iter:
-                break
-
-            if valid_tile_counter >= self.n_tiles:
-                break
 
 
 class ScoreTiler(GridTiler):
@@ -885,8 +1460,8 @@ class ScoreTiler(GridTiler):
             tile_filename = self._tile_filename(tile_wsi_coords, tiles_counter)
             tile.save(os.path.join(slide.processed_path, tile_filename))
             filenames.append(tile_filename)
-            logger.info(
-                f"\t Tile {tiles_counter} - score: {score} saved: {tile_filename}"
+            logger.debug(
+                "\t Tile %d - score: %s saved: %s", tiles_counter, score, tile_filename
             )
 
         if report_path:
@@ -894,7 +1469,7 @@ class ScoreTiler(GridTiler):
                 report_path, highest_score_tiles, highest_scaled_score_tiles, filenames
             )
 
-        logger.info(f"{tiles_counter+1} Grid Tiles have been saved.")
+        logger.info("%d Grid Tiles have been saved.", tiles_counter + 1)
 
     # ------- implementation helpers -------
 
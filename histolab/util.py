@@ -103,10 +103,12 @@ def random_choice_true_mask2d(binary_mask: np.ndarray) -> Tuple[int, int]:
     Tuple[int, int]
         Random pair of indices (column, row) where the ``binary_mask`` is True.
     """
-    y, x = np.where(binary_mask)
-    loc = np.random.randint(len(y) - 1)
+    # A single scan of the mask, and a location drawn among all the True ones
+    true_idx = np.flatnonzero(binary_mask)
+    loc = true_idx[np.random.randint(true_idx.size)]
+    y, x = np.divmod(loc, binary_mask.shape[1])
 
-    return x[loc], y[loc]
+    return x, y
 
 
 def rectangle_to_mask(dims: Tuple[int, int], vertices: CoordinatePair) -> np.ndarray:
@@ -220,6 +222,35 @@ def region_coordinates(region: Region) -> CoordinatePair:
     return CoordinatePair(*region.bbox)
 
 
+def resize_mask(binary_mask: np.ndarray, target_dims: Tuple[int, int]) -> np.ndarray:
+    """Resize a binary mask to ``target_dims`` with nearest-neighbor interpolation.
+
+    The mask is resized by indexing the rows and columns sampled at the centers of the
+    target pixels, with the same floating point steps as ``PIL.Image.resize`` with
+    nearest-neighbor resampling, so that the result is the same.
+
+    Parameters
+    ----------
+    binary_mask : np.ndarray
+        Binary mask to resize.
+    target_dims : Tuple[int, int]
+        Target (width, height) of the mask.
+
+    Returns
+    -------
+    np.ndarray
+        Resized binary mask, with shape (height, width).
+    """
+    sampled_idx = []
+    for mask_dim, target_dim in zip(binary_mask.shape[:2], target_dims[::-1]):
+        # PIL accumulates the step from the center of the first pixel
+        steps = np.full(target_dim, mask_dim / target_dim)
+        steps[0] *= 0.5
+        sampled_idx.append(np.minimum(np.cumsum(steps).astype(np.intp), mask_dim - 1))
+    rows, cols = sampled_idx
+    return binary_mask[rows[:, None], cols]
+
+
 def scale_coordinates(
     reference_coords: CoordinatePair,
     reference_size: Tuple[int, int],
@@ -183,6 +183,20 @@ class DescribeRandomTiler:
         for tile in os.listdir(processed_path):
             assert Image.open(os.path.join(processed_path, tile)).size == tile_size
 
+    def it_extracts_tiles_with_more_processes(self, tmpdir):
+        processed_path = os.path.join(tmpdir, "processed")
+        slide = Slide(TIFF.KIDNEY_48_5, processed_path)
+        random_tiles_extractor = RandomTiler(
+            tile_size=(10, 10), n_tiles=6, level=0, seed=20, check_tissue=False
+        )
+
+        random_tiles_extractor.extract(slide, BiggestTissueBoxMask(), n_workers=2)
+
+        tiles = sorted(os.listdir(processed_path))
+        assert [tile.split("_")[1] for tile in tiles] == [str(i) for i in range(6)]
+        for tile in tiles:
+            assert Image.open(os.path.join(processed_path, tile)).size == (10, 10)
+
 
 class DescribeGridTiler:
     @pytest.mark.parametrize(
@@ -1,3 +1,5 @@
+import os
+
 import numpy as np
 import pytest
 
@@ -8,6 +10,7 @@ from histolab.filters.compositions import (
 from histolab.filters.image_filters import Compose
 from histolab.filters.morphological_filters import BinaryFillHoles, RemoveSmallObjects
 from histolab.masks import BiggestTissueBoxMask, TissueMask
+from histolab.slide import Slide
 from histolab.tile import Tile
 from histolab.types import CP, Region
 
@@ -105,8 +108,55 @@ class DescribeBiggestTissueBoxMask:
             (1000, 1000), CP(x_ul=0, y_ul=0, x_br=2, y_br=2)
         )
 
+    @pytest.mark.parametrize(
+        "other, expected_value",
+        (
+            (BiggestTissueBoxMask(), True),
+            (TissueMask(), False),
+            ("BiggestTissueBoxMask", False),
+        ),
+    )
+    def it_knows_if_it_is_equal_to_another_mask(self, other, expected_value):
+        box_mask = BiggestTissueBoxMask()
+
+        assert (box_mask == other) is expected_value
+        assert (hash(box_mask) == hash(other)) is expected_value
+
+    def it_reuses_the_mask_of_a_slide_opened_twice(self, request, tmpdir):
+        slide, tmp_path_ = base_test_slide(
+            tmpdir, PILIMG.RGBA_COLOR_500X500_155_249_240
+        )
+        same_slide = Slide(os.path.join(tmp_path_, "mywsi.png"), "processed")
+        regions_from_binary_mask = function_mock(
+            request, "histolab.masks.regions_from_binary_mask"
+        )
+        regions_from_binary_mask.return_value = [
+            Region(index=0, area=33, bbox=(0, 0, 2, 2), center=(0.5, 0.5), coords=None)
+        ]
+
+        mask = BiggestTissueBoxMask()(slide)
+        same_mask = BiggestTissueBoxMask()(same_slide)
+
+        assert same_slide is not slide
+        assert same_mask is mask
+        regions_from_binary_mask.assert_called_once()
+
 
 class DescribeTissueMask:
+    @pytest.mark.parametrize(
+        "other, expected_value",
+        (
+            (TissueMask(), True),
+            (BiggestTissueBoxMask(), False),
+            ("TissueMask", False),
+        ),
+    )
+    def it_knows_if_it_is_equal_to_another_mask(self, other, expected_value):
+        tissue_mask = TissueMask()
+
+        assert (tissue_mask == other) is expected_value
+        assert (hash(tissue_mask) == hash(other)) is expected_value
+
     def it_knows_its_mask_slide(
         self,
         request,
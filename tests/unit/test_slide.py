@@ -70,6 +70,43 @@ class Describe_Slide:
         assert isinstance(err.value, TypeError)
         assert str(err.value) == "processed_path cannot be None."
 
+    @pytest.mark.parametrize(
+        "other, expected_value",
+        (
+            (Slide("/foo/bar/myslide.svs", "/foo/bar/myslide/processed"), True),
+            (Slide("/foo/bar/myslide.svs", Path("/foo/bar/myslide/processed")), True),
+            (Slide("/foo/bar/myslide2.svs", "/foo/bar/myslide/processed"), False),
+            (Slide("/foo/bar/myslide.svs", "/foo/bar/processed"), False),
+            ("/foo/bar/myslide.svs", False),
+        ),
+    )
+    def it_knows_if_it_is_equal_to_another_slide(self, other, expected_value):
+        slide = Slide("/foo/bar/myslide.svs", "/foo/bar/myslide/processed")
+
+        assert (slide == other) is expected_value
+        assert (hash(slide) == hash(other)) is expected_value
+
+    def it_shares_its_cached_properties_with_an_equal_slide(self, tmpdir):
+        slide, tmp_path_ = base_test_slide(
+            tmpdir, PILIMG.RGBA_COLOR_500X500_155_249_240
+        )
+        same_slide = Slide(os.path.join(tmp_path_, "mywsi.png"), "processed")
+
+        assert same_slide is not slide
+        assert same_slide._wsi is slide._wsi
+        assert same_slide.thumbnail is slide.thumbnail
+
+    def but_it_does_not_share_them_with_a_slide_with_another_processed_path(
+        self, tmpdir
+    ):
+        slide, tmp_path_ = base_test_slide(
+            tmpdir, PILIMG.RGBA_COLOR_500X500_155_249_240
+        )
+        other_slide = Slide(os.path.join(tmp_path_, "mywsi.png"), "other_processed")
+
+        assert other_slide != slide
+        assert other_slide._wsi is not slide._wsi
+
     @pytest.mark.parametrize("path_type_transform", [str, Path])
     def it_knows_its_wsi(self, tmpdir, path_type_transform):
         tmp_path_ = tmpdir.mkdir("myslide")
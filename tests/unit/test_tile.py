@@ -82,6 +82,15 @@ class Describe_Tile:
 
         assert os.path.exists(tmp_path_ + ".png")
 
+    def and_it_can_save_the_tile_pixels_as_a_numpy_array(self, tmpdir):
+        tmp_path_ = os.path.join(tmpdir.mkdir("mydir"), "mytile.npy")
+        _image = PILIMG.RGBA_COLOR_50X50_155_0_0
+        tile = Tile(_image, None, 0)
+
+        tile.save(tmp_path_)
+
+        np.testing.assert_array_equal(np.load(tmp_path_), np.asarray(_image))
+
     @pytest.mark.parametrize(
         "almost_white, only_some_tissue, tissue_more_than_percent, expected_value",
         (
@@ -142,6 +151,30 @@ class Describe_Tile:
 
         assert has_tissue_more_than_percent == expected_value
 
+    @pytest.mark.parametrize(
+        "n_tissue_pixels, n_pixels, percent, expected_value",
+        (
+            (7, 10, 70.0, False),
+            (11, 20, 55.0, False),
+            (29, 100, 29.0, False),
+            (1, 3, 100 / 3, False),
+            (11, 20, 54.99, True),
+            (8, 10, 79.9, True),
+        ),
+    )
+    def it_knows_if_has_tissue_more_than_percent_at_the_boundary(
+        self, request, n_tissue_pixels, n_pixels, percent, expected_value
+    ):
+        tissue_mask = np.zeros((1, n_pixels), dtype=bool)
+        tissue_mask[0, :n_tissue_pixels] = True
+        _compose_call = method_mock(request, Compose, "__call__")
+        _compose_call.return_value = tissue_mask
+
+        tile = Tile(None, None, 0)
+        has_tissue_more_than_percent = tile._has_tissue_more_than_percent(percent)
+
+        assert has_tissue_more_than_percent == expected_value
+
     def it_calls_tile_tissue_mask_filters(
         self,
     ):
@@ -2,18 +2,20 @@ import csv
 import logging
 import os
 import re
+from dataclasses import dataclass
 from unittest.mock import call
 
 import numpy as np
 import pytest
 
 from histolab.exceptions import LevelError, TileSizeError
-from histolab.masks import BiggestTissueBoxMask
+from histolab.masks import BiggestTissueBoxMask, BinaryMask
 from histolab.scorer import RandomScorer
 from histolab.slide import Slide
 from histolab.tile import Tile
 from histolab.tiler import GridTiler, RandomTiler, ScoreTiler, Tiler
 from histolab.types import CP
+from histolab.util import scale_coordinates
 
 from ..base import COMPLEX_MASK4
 from ..unitutil import (
@@ -25,7 +27,6 @@ from ..unitutil import (
     initializer_mock,
     instance_mock,
     method_mock,
-    property_mock,
 )
 
 
@@ -71,9 +72,10 @@ class Describe_RandomTiler:
             "the maximum number of tiles (10)."
         )
 
-    def or_it_has_wrong_seed(self, tmpdir):
+    @pytest.mark.parametrize("seed", (-1, 2**32))
+    def or_it_has_wrong_seed(self, tmpdir, seed):
         slide, _ = base_test_slide(tmpdir, PILIMG.RGB_RANDOM_COLOR_500X500)
-        random_tiler = RandomTiler((128, 128), 10, 0, seed=-1)
+        random_tiler = RandomTiler((128, 128), 10, 0, seed=seed)
         binary_mask = BiggestTissueBoxMask()
 
         with pytest.raises(ValueError) as err:
@@ -82,6 +84,23 @@ class Describe_RandomTiler:
         assert isinstance(err.value, ValueError)
         assert str(err.value) == "Seed must be between 0 and 2**32 - 1"
 
+    @pytest.mark.parametrize(
+        "suffix, fast_write, expected_suffix",
+        (
+            (".png", False, ".png"),
+            (".png", True, ".tiff"),
+            (".jpg", True, ".jpg"),
+            (".npy", True, ".npy"),
+        ),
+    )
+    def it_knows_its_suffix(self, suffix, fast_write, expected_suffix):
+        random_tiler = RandomTiler(
+            (10, 10), 10, 0, suffix=suffix, fast_write=fast_write
+        )
+
+        assert random_tiler.suffix == expected_suffix
+        assert random_tiler.fast_write is fast_write
+
     @pytest.mark.parametrize("tile_size", ((512, 512), (128, 128), (10, 10)))
     def it_knows_its_tile_size(self, tile_size):
         random_tiler = RandomTiler(tile_size, 10, 0)
@@ -124,6 +143,16 @@ class Describe_RandomTiler:
         assert type(_filename) == str
         assert _filename == expected_filename
 
+    def it_knows_its_tile_filename_after_changing_its_attributes(self):
+        random_tiler = RandomTiler((512, 512), 10, 0, prefix="a/", suffix=".png")
+        random_tiler.prefix = "b/"
+        random_tiler.level = 2
+        random_tiler.suffix = ".npy"
+
+        _filename = random_tiler._tile_filename(CP(0, 10, 5, 15), 3)
+
+        assert _filename == "b/tile_3_level2_0-10-5-15.npy"
+
     @pytest.mark.parametrize(
         "tile_size, expected_result", [((512, 512), False), ((200, 200), True)]
     )
@@ -136,33 +165,330 @@ class Describe_RandomTiler:
         assert type(result) == bool
         assert result == expected_result
 
-    def it_can_generate_random_coordinates(self, request, tmpdir):
+    @pytest.mark.parametrize(
+        "tile_size, level, expected_tile_size_mask",
+        (
+            ((128, 128), 0, (128.0, 128.0)),
+            ((128, 128), 1, (512.0, 512.0)),
+            ((100, 50), 1, (400.0, 200.0)),
+        ),
+    )
+    def it_knows_the_tile_size_in_the_mask_space(
+        self, request, tile_size, level, expected_tile_size_mask
+    ):
+        slide = instance_mock(request, Slide)
+        slide.level_dimensions.return_value = (500 // 4**level, 500 // 4**level)
+        random_tiler = RandomTiler(tile_size, 10, level)
+
+        tile_size_mask = random_tiler._tile_size_mask(
+            slide, NpArrayMock.ONES_500X500_BOOL
+        )
+
+        assert tile_size_mask == expected_tile_size_mask
+        slide.level_dimensions.assert_called_once_with(level)
+
+    def it_can_generate_tiles_wsi_coordinates(self):
+        tiles_wsi_coords = RandomTiler._tiles_wsi_coordinates(
+            np.array([5, 0, 7]),
+            np.array([3, 2, 1]),
+            (128.0, 64.0),
+            (500, 400),
+            (1000, 800),
+        )
+
+        assert tiles_wsi_coords.dtype == np.int64
+        np.testing.assert_array_equal(
+            tiles_wsi_coords,
+            [[10, 6, 266, 134], [0, 4, 256, 132], [14, 2, 270, 130]],
+        )
+
+    def and_it_scales_the_coordinates_as_scale_coordinates(self):
+        xs, ys = np.array([5, 17, 333]), np.array([3, 29, 71])
+
+        tiles_wsi_coords = RandomTiler._tiles_wsi_coordinates(
+            xs, ys, (3.7, 5.3), (500, 400), (12345, 6789)
+        )
+
+        for x_ul_mask, y_ul_mask, tile_wsi_coords in zip(xs, ys, tiles_wsi_coords):
+            assert CP(*tile_wsi_coords) == scale_coordinates(
+                CP(x_ul_mask, y_ul_mask, x_ul_mask + 3.7, y_ul_mask + 5.3),
+                (500, 400),
+                (12345, 6789),
+            )
+
+    def it_shifts_the_tiles_overflowing_the_slide_inside_of_it(self):
+        tiles_wsi_coords = RandomTiler._tiles_wsi_coordinates(
+            np.array([495, 10, 499, 489]),
+            np.array([10, 495, 499, 489]),
+            (10.0, 10.0),
+            (500, 500),
+            (500, 500),
+        )
+
+        np.testing.assert_array_equal(
+            tiles_wsi_coords,
+            [
+                [489, 10, 499, 20],
+                [10, 489, 20, 499],
+                [489, 489, 499, 499],
+                [489, 489, 499, 499],
+            ],
+        )
+
+    def it_draws_coordinates_from_the_shape_when_there_are_no_true_indices(self):
+        random_tiler = RandomTiler((10, 10), 10, 0)
+
+        tiles_wsi_coords = random_tiler._random_tiles_wsi_coordinates(
+            np.ones((20, 30), dtype=bool),
+            None,
+            None,
+            (1.0, 1.0),
+            (30, 20),
+            np.random.default_rng(0),
+        )
+        x_ul, y_ul, _, _ = np.array([next(tiles_wsi_coords) for _ in range(100)]).T
+
+        assert 0 <= min(x_ul) and max(x_ul) < 30
+        assert 0 <= min(y_ul) and max(y_ul) < 20
+
+    @pytest.mark.parametrize(
+        "binary_mask, expected_dtype",
+        (
+            (COMPLEX_MASK4, np.uint8),
+            (np.eye(300, dtype=bool), np.uint32),
+            (np.eye(70000, 1, dtype=bool), np.uint32),
+        ),
+    )
+    def it_knows_the_true_indices_of_the_binary_mask(self, binary_mask, expected_dtype):
+        mask_true_idx = RandomTiler._mask_true_idx(binary_mask)
+
+        assert mask_true_idx.dtype == expected_dtype
+        np.testing.assert_array_equal(mask_true_idx, np.flatnonzero(binary_mask))
+
+    def but_it_has_no_true_indices_when_the_mask_is_all_true(self):
+        assert RandomTiler._mask_true_idx(NpArrayMock.ONES_500X500_BOOL) is None
+
+    @pytest.mark.parametrize("seed", range(10))
+    def it_draws_random_coordinates_inside_the_binary_mask(self, seed):
+        random_tiler = RandomTiler((10, 10), 10, 0, seed=seed)
+
+        tiles_wsi_coords = random_tiler._random_tiles_wsi_coordinates(
+            COMPLEX_MASK4,
+            RandomTiler._mask_true_idx(COMPLEX_MASK4),
+            RandomTiler._mask_integral(COMPLEX_MASK4),
+            (1.0, 1.0),
+            (100, 100),
+            np.random.default_rng(seed),
+        )
+
+        for _ in range(100):
+            x_ul, y_ul, _, _ = next(tiles_wsi_coords)
+            assert COMPLEX_MASK4[y_ul // 10, x_ul // 10]
+
+    @pytest.mark.parametrize(
+        "n_tiles, max_iter, expected_batch_sizes",
+        ((10, 100, [40, 40, 20]), (10, 20, [20]), (0, 3, [1, 1, 1])),
+    )
+    def it_draws_max_iter_random_coordinates_in_batches(
+        self, request, n_tiles, max_iter, expected_batch_sizes
+    ):
+        _draw_coord_batch = method_mock(request, RandomTiler, "_draw_coord_batch")
+        _draw_coord_batch.side_effect = lambda self, mask, idx, size, rng: (
+            np.arange(size),
+            np.arange(size),
+        )
+        random_tiler = RandomTiler(
+            (10, 10), n_tiles, 0, check_tissue=False, max_iter=max_iter
+        )
+        rng = np.random.default_rng(0)
+
+        tiles_wsi_coords = list(
+            random_tiler._random_tiles_wsi_coordinates(
+                COMPLEX_MASK4, None, None, (1.0, 1.0), (10, 10), rng
+            )
+        )
+
+        assert len(tiles_wsi_coords) == max_iter
+        assert tiles_wsi_coords[0].tolist() == [0, 0, 1, 1]
+        assert _draw_coord_batch.call_args_list == [
+            call(random_tiler, COMPLEX_MASK4, ANY, batch_size, rng)
+            for batch_size in expected_batch_sizes
+        ]
+
+    def it_discards_the_tiles_not_within_the_mask_when_checking_tissue(self, request):
+        _draw_coord_batch = method_mock(request, RandomTiler, "_draw_coord_batch")
+        _draw_coord_batch.return_value = (np.array([3, 0, 5]), np.array([4, 0, 7]))
+        random_tiler = RandomTiler((10, 10), 10, 0)
+
+        tiles_wsi_coords = random_tiler._random_tiles_wsi_coordinates(
+            COMPLEX_MASK4,
+            None,
+            RandomTiler._mask_integral(COMPLEX_MASK4),
+            (2.0, 2.0),
+            (10, 10),
+            np.random.default_rng(0),
+        )
+        drawn_coords = [next(tiles_wsi_coords).tolist() for _ in range(2)]
+
+        assert drawn_coords == [[3, 4, 5, 6], [3, 4, 5, 6]]
+        assert _draw_coord_batch.call_count == 2
+
+    def but_it_stops_at_max_iter_when_no_tile_is_within_the_mask(self):
+        random_tiler = RandomTiler((10, 10), 1, 0, max_iter=50)
+
+        tiles_wsi_coords = random_tiler._random_tiles_wsi_coordinates(
+            COMPLEX_MASK4,
+            RandomTiler._mask_true_idx(COMPLEX_MASK4),
+            RandomTiler._mask_integral(COMPLEX_MASK4),
+            (50.0, 50.0),
+            (100, 100),
+            np.random.default_rng(7),
+        )
+
+        assert list(tiles_wsi_coords) == []
+
+    def it_knows_the_summed_area_table_of_the_binary_mask(self):
+        mask_integral = RandomTiler._mask_integral(COMPLEX_MASK4)
+
+        assert mask_integral.shape == (11, 11)
+        assert mask_integral.dtype == np.uint8
+        assert mask_integral[0].sum() == mask_integral[:, 0].sum() == 0
+        assert mask_integral[-1, -1] == np.count_nonzero(COMPLEX_MASK4)
+        assert mask_integral[4, 6] == np.count_nonzero(COMPLEX_MASK4[:4, :6])
+
+    @pytest.mark.parametrize("check_tissue", (True, False))
+    def it_shares_the_mask_sampling_tables_across_tilers(self, check_tissue):
+        mask_true_idx, mask_integral = RandomTiler(
+            (10, 10), 1, check_tissue=check_tissue
+        )._mask_sampling_tables(COMPLEX_MASK4, check_tissue)
+        mask_sampling_tables = RandomTiler(
+            (20, 20), 5, check_tissue=check_tissue
+        )._mask_sampling_tables(COMPLEX_MASK4.copy(), check_tissue)
+
+        assert mask_sampling_tables[0] is mask_true_idx
+        assert mask_sampling_tables[1] is mask_integral
+        assert (mask_integral is not None) == check_tissue
+        np.testing.assert_array_equal(mask_true_idx, np.flatnonzero(COMPLEX_MASK4))
+
+    def but_it_computes_new_tables_when_the_mask_changes(self):
+        binary_mask = COMPLEX_MASK4.copy()
+        mask_true_idx, mask_integral = RandomTiler._mask_sampling_tables(
+            binary_mask, True
+        )
+        binary_mask[0, 0] = True
+
+        new_mask_true_idx, new_mask_integral = RandomTiler._mask_sampling_tables(
+            binary_mask, True
+        )
+
+        np.testing.assert_array_equal(new_mask_true_idx, np.flatnonzero(binary_mask))
+        assert new_mask_integral[-1, -1] == mask_integral[-1, -1] + 1
+
+    def it_draws_the_tiles_from_the_mask_computed_by_each_extraction(
+        self, request, tmpdir
+    ):
+        @dataclass
+        class ChangingMask(BinaryMask):
+            masks: list
+
+            def _mask(self, slide):
+                return self.masks.pop(0)
+
         slide, _ = base_test_slide(tmpdir, PILIMG.RGBA_COLOR_500X500_155_249_240)
-        _box_mask_thumb = method_mock(request, BiggestTissueBoxMask, "__call__")
-        _box_mask_thumb.return_value = NpArrayMock.ONES_500X500_BOOL
-        _tile_size = property_mock(request, RandomTiler, "tile_size")
-        _tile_size.return_value = (128, 128)
-        _random_choice_true_mask2d = function_mock(
-            request, "histolab.tiler.random_choice_true_mask2d"
-        )
-        _random_choice_true_mask2d.return_value = (0, 0)
-        _scale_coordinates = function_mock(request, "histolab.tiler.scale_coordinates")
-        random_tiler = RandomTiler((128, 128), 10, 0)
-        binary_mask = BiggestTissueBoxMask()
+        _random_tiles = method_mock(request, RandomTiler, "_random_tiles")
+        _random_tiles.return_value = []
+        top_mask = np.zeros((10, 10), dtype=bool)
+        top_mask[:5] = True
+        bottom_mask = ~top_mask
+        extraction_mask = ChangingMask([top_mask, bottom_mask])
+        random_tiler = RandomTiler((10, 10), n_tiles=2, level=0)
+
+        for _ in range(2):
+            random_tiler.extract(slide, extraction_mask)
+
+        assert extraction_mask.masks == []
+        for (_, _, mask, mask_true_idx, mask_integral), expected_mask in zip(
+            (call_args[0] for call_args in _random_tiles.call_args_list),
+            (top_mask, bottom_mask),
+        ):
+            assert mask is expected_mask
+            np.testing.assert_array_equal(mask_true_idx, np.flatnonzero(mask))
+            np.testing.assert_array_equal(
+                mask_integral, RandomTiler._mask_integral(mask)
+            )
+
+    @pytest.mark.parametrize(
+        "xs, ys, tile_size_mask, expected_value",
+        (
+            ([3, 0, 5, 4], [4, 0, 7, 3], (2.0, 2.0), [True, False, False, True]),
+            ([3, 5, 2], [3, 7, 5], (1.0, 1.0), [True, True, True]),
+            ([3, 5, 2], [3, 7, 5], (0.3, 0.2), [True, True, True]),
+            ([3, 2, 5], [3, 2, 8], (4.0, 4.0), [True, False, False]),
+            ([3, 3, 8], [3, 4, 8], (3.5, 2.1), [True, True, False]),
+        ),
+    )
+    def it_knows_which_tiles_are_within_the_extraction_mask(
+        self, xs, ys, tile_size_mask, expected_value
+    ):
+        mask_integral = RandomTiler._mask_integral(COMPLEX_MASK4)
+
+        are_within_mask = RandomTiler._are_within_extraction_mask(
+            np.array(xs), np.array(ys), tile_size_mask, mask_integral, 80.0
+        )
 
-        random_tiler._random_tile_coordinates(slide, binary_mask)
+        np.testing.assert_array_equal(are_within_mask, expected_value)
 
-        _box_mask_thumb.assert_called_once_with(binary_mask, slide)
-        _tile_size.assert_has_calls([call((128, 128))])
-        _random_choice_true_mask2d.assert_called_once_with(
-            NpArrayMock.ONES_500X500_BOOL
+    @pytest.mark.parametrize(
+        "tissue_percent, expected_value",
+        (
+            (10.0, [True, True, False]),
+            (49.0, [True, True, False]),
+            (50.0, [True, False, False]),
+            (80.0, [True, False, False]),
+        ),
+    )
+    def it_checks_the_tiles_within_the_extraction_mask_against_the_tissue_percent(
+        self, tissue_percent, expected_value
+    ):
+        binary_mask = np.zeros((100, 100), dtype=bool)
+        binary_mask[:, :50] = True
+        mask_integral = RandomTiler._mask_integral(binary_mask)
+
+        are_within_mask = RandomTiler._are_within_extraction_mask(
+            np.array([10, 40, 60]),
+            np.array([10, 40, 60]),
+            (20.0, 20.0),
+            mask_integral,
+            tissue_percent,
         )
-        _scale_coordinates.assert_called_once_with(
-            reference_coords=CP(x_ul=0, y_ul=0, x_br=128, y_br=128),
-            reference_size=(500, 500),
-            target_size=(500, 500),
+
+        np.testing.assert_array_equal(are_within_mask, expected_value)
+
+    def it_knows_the_tiles_within_the_extraction_mask_with_unsigned_sums(self):
+        binary_mask = np.ones((200, 200), dtype=bool)
+        binary_mask[150:] = False
+        mask_integral = RandomTiler._mask_integral(binary_mask)
+
+        are_within_mask = RandomTiler._are_within_extraction_mask(
+            np.array([50, 50, 50]),
+            np.array([0, 50, 100]),
+            (100.0, 100.0),
+            mask_integral,
+            80.0,
         )
 
+        assert mask_integral.dtype == np.uint16
+        np.testing.assert_array_equal(are_within_mask, [True, True, False])
+
+    def it_shifts_the_tiles_overflowing_the_extraction_mask_inside_of_it(self):
+        mask_integral = RandomTiler._mask_integral(np.ones((10, 10), dtype=bool))
+
+        are_within_mask = RandomTiler._are_within_extraction_mask(
+            np.array([9, 0, 8]), np.array([9, 8, 0]), (4.0, 3.0), mask_integral, 80.0
+        )
+
+        np.testing.assert_array_equal(are_within_mask, [True, True, True])
+
     @pytest.mark.parametrize(
         "tile1, tile2, has_enough_tissue, max_iter, expected_value",
         (
@@ -198,15 +524,20 @@ class Describe_RandomTiler:
         has_enough_tissue,
         max_iter,
         expected_value,
-        _random_tile_coordinates,
+        _random_tiles_wsi_coordinates,
     ):
         slide, _ = base_test_slide(tmpdir, PILIMG.RGBA_COLOR_500X500_155_249_240)
+        _box_mask_thumb = method_mock(request, BiggestTissueBoxMask, "__call__")
+        _box_mask_thumb.return_value = NpArrayMock.ONES_500X500_BOOL
         _extract_tile = method_mock(request, Slide, "extract_tile")
         _has_enough_tissue = method_mock(request, Tile, "has_enough_tissue")
         _has_enough_tissue.side_effect = has_enough_tissue * (max_iter // 2)
         binary_mask = BiggestTissueBoxMask()
         tiles = [tile1, tile2]
         _extract_tile.side_effect = tiles * (max_iter // 2)
+        _random_tiles_wsi_coordinates.return_value = iter(
+            [np.array([0, 0, 10, 10])] * max_iter
+        )
         random_tiler = RandomTiler(
             (10, 10),
             2,
@@ -218,9 +549,17 @@ class Describe_RandomTiler:
 
         generated_tiles = list(random_tiler._tiles_generator(slide, binary_mask))
 
-        _random_tile_coordinates.assert_called_with(random_tiler, slide, binary_mask)
+        _random_tiles_wsi_coordinates.assert_called_once_with(
+            random_tiler,
+            NpArrayMock.ONES_500X500_BOOL,
+            None,
+            ANY,
+            (10.0, 10.0),
+            (500, 500),
+            ANY,
+        )
         assert _has_enough_tissue.call_args_list == [call(tile1, 60), call(tile2, 60)]
-        assert _random_tile_coordinates.call_count <= random_tiler.max_iter
+        assert _extract_tile.call_count <= random_tiler.max_iter
         assert len(generated_tiles) == expected_value
         for i, tile in enumerate(generated_tiles):
             assert tile[0] == tiles[i]
@@ -229,9 +568,11 @@ class Describe_RandomTiler:
         self,
         request,
         tmpdir,
-        _random_tile_coordinates,
+        _random_tiles_wsi_coordinates,
     ):
         slide, _ = base_test_slide(tmpdir, PILIMG.RGBA_COLOR_500X500_155_249_240)
+        _box_mask_thumb = method_mock(request, BiggestTissueBoxMask, "__call__")
+        _box_mask_thumb.return_value = NpArrayMock.ONES_500X500_BOOL
         _extract_tile = method_mock(request, Slide, "extract_tile")
         _has_enough_tissue = method_mock(request, Tile, "has_enough_tissue")
         _has_enough_tissue.side_effect = [False, False] * 5
@@ -252,7 +593,15 @@ class Describe_RandomTiler:
 
         generated_tiles = list(random_tiler._tiles_generator(slide, binary_mask))
 
-        _random_tile_coordinates.assert_called_with(random_tiler, slide, binary_mask)
+        _random_tiles_wsi_coordinates.assert_called_once_with(
+            random_tiler,
+            NpArrayMock.ONES_500X500_BOOL,
+            None,
+            ANY,
+            (10.0, 10.0),
+            (500, 500),
+            ANY,
+        )
         assert (
             _has_enough_tissue.call_args_list
             == [
@@ -261,7 +610,7 @@ class Describe_RandomTiler:
             ]
             * 5
         )
-        assert _random_tile_coordinates.call_count <= random_tiler.max_iter
+        assert _extract_tile.call_count <= random_tiler.max_iter
         assert len(generated_tiles) == 0
         for i, tile in enumerate(generated_tiles):
             assert tile[0] == tiles[i]
@@ -294,15 +643,20 @@ class Describe_RandomTiler:
         has_enough_tissue,
         max_iter,
         expected_value,
-        _random_tile_coordinates,
+        _random_tiles_wsi_coordinates,
     ):
         slide, _ = base_test_slide(tmpdir, PILIMG.RGBA_COLOR_500X500_155_249_240)
+        _box_mask_thumb = method_mock(request, BiggestTissueBoxMask, "__call__")
+        _box_mask_thumb.return_value = NpArrayMock.ONES_500X500_BOOL
         _extract_tile = method_mock(request, Slide, "extract_tile")
         _has_enough_tissue = method_mock(request, Tile, "has_enough_tissue")
         _has_enough_tissue.side_effect = has_enough_tissue * (max_iter // 2)
         tiles = [tile1, tile2]
         binary_mask = BiggestTissueBoxMask()
         _extract_tile.side_effect = tiles * (max_iter // 2)
+        _random_tiles_wsi_coordinates.return_value = iter(
+            [np.array([0, 0, 10, 10])] * max_iter
+        )
         random_tiler = RandomTiler(
             (10, 10),
             2,
@@ -313,18 +667,86 @@ class Describe_RandomTiler:
 
         generated_tiles = list(random_tiler._tiles_generator(slide, binary_mask))
 
-        _random_tile_coordinates.assert_called_with(random_tiler, slide, binary_mask)
+        _random_tiles_wsi_coordinates.assert_called_once_with(
+            random_tiler,
+            NpArrayMock.ONES_500X500_BOOL,
+            None,
+            ANY,
+            (10.0, 10.0),
+            (500, 500),
+            ANY,
+        )
         _has_enough_tissue.assert_not_called()
-        assert _random_tile_coordinates.call_count <= random_tiler.max_iter
+        assert _extract_tile.call_count <= random_tiler.max_iter
         assert len(generated_tiles) == expected_value
         for i, tile in enumerate(generated_tiles):
             assert tile[0] == tiles[i]
 
-    def it_can_generate_random_tiles_even_when_coords_are_not_valid(
-        self, tmpdir, _random_tile_coordinates
+    def it_draws_the_same_tiles_at_each_run_leaving_the_global_random_state(
+        self, request, tmpdir
     ):
-        random_tiler = RandomTiler((10, 10), 1, level=0, max_iter=1, check_tissue=False)
-        _random_tile_coordinates.side_effect = [CP(-1, -1, -1, -1), CP(0, 0, 10, 10)]
+        slide, _ = base_test_slide(tmpdir, PILIMG.RGBA_COLOR_500X500_155_249_240)
+        _box_mask_thumb = method_mock(request, BiggestTissueBoxMask, "__call__")
+        _box_mask_thumb.return_value = NpArrayMock.ONES_500X500_BOOL
+        method_mock(request, Slide, "extract_tile")
+        random_tiler = RandomTiler((10, 10), 20, level=0, check_tissue=False)
+        np.random.seed(0)
+        global_random_state = np.random.get_state()[1].copy()
+
+        tiles_coords = [
+            [coords for _, coords in random_tiler._tiles_generator(slide)]
+            for _ in range(2)
+        ]
+
+        assert len(tiles_coords[0]) == 20
+        assert tiles_coords[0] == tiles_coords[1]
+        np.testing.assert_array_equal(np.random.get_state()[1], global_random_state)
+
+    def it_stops_after_max_iter_draws_on_a_sparse_mask(self, request, tmpdir):
+        slide, _ = base_test_slide(tmpdir, PILIMG.RGBA_COLOR_500X500_155_249_240)
+        _box_mask_thumb = method_mock(request, BiggestTissueBoxMask, "__call__")
+        _box_mask_thumb.return_value = COMPLEX_MASK4
+        _extract_tile = method_mock(request, Slide, "extract_tile")
+        _draw_coord_batch = method_mock(request, RandomTiler, "_draw_coord_batch")
+        # The tiles drawn in the corner of the mask are never within it
+        _draw_coord_batch.side_effect = lambda self, mask, idx, size, rng: (
+            np.zeros(size, dtype=int),
+            np.zeros(size, dtype=int),
+        )
+        random_tiler = RandomTiler((50, 50), 1, level=0, max_iter=7)
+
+        generated_tiles = list(
+            random_tiler._tiles_generator(slide, BiggestTissueBoxMask())
+        )
+
+        assert generated_tiles == []
+        assert [args[0][3] for args in _draw_coord_batch.call_args_list] == [4, 3]
+        _extract_tile.assert_not_called()
+
+    def it_draws_the_same_tiles_when_runs_are_interleaved(self, request, tmpdir):
+        slide, _ = base_test_slide(tmpdir, PILIMG.RGBA_COLOR_500X500_155_249_240)
+        _box_mask_thumb = method_mock(request, BiggestTissueBoxMask, "__call__")
+        _box_mask_thumb.return_value = COMPLEX_MASK4
+        method_mock(request, Slide, "extract_tile")
+        method_mock(request, Tile, "has_enough_tissue")
+        # Few candidates are within the mask, so each run draws more than one batch
+        random_tiler = RandomTiler((150, 150), 20, level=0, tissue_percent=95)
+        tiles_coords = [coords for _, coords in random_tiler._tiles_generator(slide)]
+
+        runs = [random_tiler._tiles_generator(slide) for _ in range(2)]
+        interleaved_tiles_coords = [[next(run)[1] for run in runs] for _ in range(20)]
+
+        assert interleaved_tiles_coords == [[coords] * 2 for coords in tiles_coords]
+
+    def it_skips_the_tiles_which_cannot_be_extracted(
+        self, request, tmpdir, _random_tiles_wsi_coordinates
+    ):
+        _box_mask_thumb = method_mock(request, BiggestTissueBoxMask, "__call__")
+        _box_mask_thumb.return_value = NpArrayMock.ONES_500X500_BOOL
+        random_tiler = RandomTiler((10, 10), 1, level=0, max_iter=2, check_tissue=False)
+        _random_tiles_wsi_coordinates.return_value = iter(
+            [np.array([-1, -1, -1, -1]), np.array([0, 0, 10, 10])]
+        )
         slide, _ = base_test_slide(tmpdir, PILIMG.RGBA_COLOR_500X500_155_249_240)
         binary_mask = BiggestTissueBoxMask()
 
@@ -334,16 +756,54 @@ class Describe_RandomTiler:
         assert generated_tiles[0][1] == CP(0, 0, 10, 10)
         assert isinstance(generated_tiles[0][0], Tile)
 
+    def it_stops_when_n_tiles_have_been_generated(
+        self, request, tmpdir, _random_tiles_wsi_coordinates
+    ):
+        slide, _ = base_test_slide(tmpdir, PILIMG.RGBA_COLOR_500X500_155_249_240)
+        _box_mask_thumb = method_mock(request, BiggestTissueBoxMask, "__call__")
+        _box_mask_thumb.return_value = NpArrayMock.ONES_500X500_BOOL
+        _extract_tile = method_mock(request, Slide, "extract_tile")
+        _extract_tile.return_value = Tile(
+            PILIMG.RGBA_COLOR_500X500_155_249_240, CP(0, 0, 10, 10)
+        )
+        _has_enough_tissue = method_mock(request, Tile, "has_enough_tissue")
+        _has_enough_tissue.side_effect = [False, True, True]
+        random_tiler = RandomTiler((10, 10), 2, level=0, max_iter=10)
+
+        generated_tiles = list(
+            random_tiler._tiles_generator(slide, BiggestTissueBoxMask())
+        )
+
+        assert len(generated_tiles) == 2
+        assert _extract_tile.call_count == 3
+
+    @pytest.mark.parametrize("max_iter", (0, 10))
+    def but_it_generates_no_tiles_when_n_tiles_is_zero(self, request, tmpdir, max_iter):
+        slide, _ = base_test_slide(tmpdir, PILIMG.RGBA_COLOR_500X500_155_249_240)
+        _box_mask_thumb = method_mock(request, BiggestTissueBoxMask, "__call__")
+        _box_mask_thumb.return_value = COMPLEX_MASK4
+        _extract_tile = method_mock(request, Slide, "extract_tile")
+        random_tiler = RandomTiler((10, 10), 0, level=0, max_iter=max_iter)
+
+        generated_tiles = list(
+            random_tiler._tiles_generator(slide, BiggestTissueBoxMask())
+        )
+
+        assert generated_tiles == []
+        _extract_tile.assert_not_called()
+
     def it_can_extract_random_tiles(self, request, tmpdir, caplog):
         tmp_path_ = tmpdir.mkdir("myslide")
         image = PILIMG.RGBA_COLOR_500X500_155_249_240
         image.save(os.path.join(tmp_path_, "mywsi.png"), "PNG")
         slide_path = os.path.join(tmp_path_, "mywsi.png")
         slide = Slide(slide_path, os.path.join(tmp_path_, "processed"))
-        _tiles_generator = method_mock(request, RandomTiler, "_tiles_generator")
+        _box_mask_thumb = method_mock(request, BiggestTissueBoxMask, "__call__")
+        _box_mask_thumb.return_value = COMPLEX_MASK4
+        _random_tiles = method_mock(request, RandomTiler, "_random_tiles")
         coords = CP(0, 0, 10, 10)
         tile = Tile(image, coords)
-        _tiles_generator.return_value = [(tile, coords), (tile, coords)]
+        _random_tiles.return_value = [(tile, coords), (tile, coords)]
         _tile_filename = method_mock(request, RandomTiler, "_tile_filename")
         _tile_filename.side_effect = [
             f"tile_{i}_level2_0-0-10-10.png" for i in range(2)
@@ -353,12 +813,12 @@ class Describe_RandomTiler:
         random_tiler = RandomTiler((10, 10), n_tiles=2, level=0)
         binary_mask = BiggestTissueBoxMask()
 
-        with caplog.at_level(logging.INFO):
-            random_tiler.extract(slide, binary_mask)
+        with caplog.at_level(logging.DEBUG, logger="tiler"):
+            random_tiler.extract(slide, binary_mask, log_level="DEBUG")
 
         assert re.sub(r":+\d{3}", "", caplog.text).splitlines() == [
-            "INFO     tiler:tiler.py \t Tile 0 saved: tile_0_level2_0-0-10-10.png",
-            "INFO     tiler:tiler.py \t Tile 1 saved: tile_1_level2_0-0-10-10.png",
+            "DEBUG    tiler:tiler.py \t Tile 0 saved: tile_0_level2_0-0-10-10.png",
+            "DEBUG    tiler:tiler.py \t Tile 1 saved: tile_1_level2_0-0-10-10.png",
             "INFO     tiler:tiler.py 2 Random Tiles have been saved.",
         ]
         assert _tile_filename.call_args_list == [
@@ -372,6 +832,159 @@ class Describe_RandomTiler:
             os.path.join(tmp_path_, "processed", "tile_1_level2_0-0-10-10.png")
         )
         _has_valid_tile_size.assert_called_once_with(random_tiler, slide)
+        _random_tiles.assert_called_once_with(random_tiler, slide, ANY, ANY, ANY)
+        _, _, mask, mask_true_idx, mask_integral = _random_tiles.call_args[0]
+        assert mask is COMPLEX_MASK4
+        np.testing.assert_array_equal(
+            mask_true_idx, RandomTiler._mask_true_idx(COMPLEX_MASK4)
+        )
+        np.testing.assert_array_equal(
+            mask_integral, RandomTiler._mask_integral(COMPLEX_MASK4)
+        )
+
+    def it_logs_only_the_summary_of_the_saved_tiles_by_default(
+        self, request, tmpdir, caplog
+    ):
+        slide, _ = base_test_slide(tmpdir, PILIMG.RGBA_COLOR_500X500_155_249_240)
+        _box_mask_thumb = method_mock(request, BiggestTissueBoxMask, "__call__")
+        _box_mask_thumb.return_value = NpArrayMock.ONES_500X500_BOOL
+        _random_tiles = method_mock(request, RandomTiler, "_random_tiles")
+        coords = CP(0, 0, 10, 10)
+        tile = Tile(PILIMG.RGBA_COLOR_500X500_155_249_240, coords)
+        _random_tiles.return_value = [(tile, coords), (tile, coords)]
+        method_mock(request, Tile, "save")
+        random_tiler = RandomTiler((10, 10), n_tiles=2, level=0)
+
+        with caplog.at_level(logging.DEBUG, logger="tiler"):
+            random_tiler.extract(slide, BiggestTissueBoxMask())
+
+        assert re.sub(r":+\d{3}", "", caplog.text).splitlines() == [
+            "INFO     tiler:tiler.py 2 Random Tiles have been saved.",
+        ]
+
+    def but_it_raises_the_errors_occurred_while_saving_the_tiles(self, request, tmpdir):
+        slide, _ = base_test_slide(tmpdir, PILIMG.RGBA_COLOR_500X500_155_249_240)
+        _box_mask_thumb = method_mock(request, BiggestTissueBoxMask, "__call__")
+        _box_mask_thumb.return_value = NpArrayMock.ONES_500X500_BOOL
+        _random_tiles = method_mock(request, RandomTiler, "_random_tiles")
+        coords = CP(0, 0, 10, 10)
+        tile = Tile(PILIMG.RGBA_COLOR_500X500_155_249_240, coords)
+        _random_tiles.return_value = [(tile, coords)]
+        _save = method_mock(request, Tile, "save")
+        _save.side_effect = OSError("disk full")
+        random_tiler = RandomTiler((10, 10), n_tiles=1, level=0)
+
+        with pytest.raises(OSError) as err:
+            random_tiler.extract(slide, BiggestTissueBoxMask())
+
+        assert str(err.value) == "disk full"
+
+    def it_can_extract_random_tiles_with_more_processes(self, request, tmpdir, caplog):
+        slide, _ = base_test_slide(tmpdir, PILIMG.RGBA_COLOR_500X500_155_249_240)
+        _box_mask_thumb = method_mock(request, BiggestTissueBoxMask, "__call__")
+        _box_mask_thumb.return_value = NpArrayMock.ONES_500X500_BOOL
+        _available_cpus = method_mock(request, RandomTiler, "_available_cpus")
+        _available_cpus.return_value = 5
+        _get_context = function_mock(
+            request, "histolab.tiler.multiprocessing.get_context"
+        )
+        _pool = _get_context.return_value.Pool
+        _pool.return_value.__enter__.return_value.starmap.return_value = [
+            [(0, "tile_0.png"), (1, "tile_1.png")],
+            [(2, "tile_2.png")],
+        ]
+        random_tiler = RandomTiler((10, 10), n_tiles=3, level=0)
+
+        with caplog.at_level(logging.DEBUG, logger="tiler"):
+            random_tiler.extract(
+                slide, BiggestTissueBoxMask(), log_level="DEBUG", n_workers=2
+            )
+
+        _get_context.assert_called_once_with("spawn")
+        _pool.assert_called_once_with(2)
+        starmap_args = _pool.return_value.__enter__.return_value.starmap.call_args[0]
+        assert starmap_args[0] == RandomTiler._extract_shard
+        assert [
+            (shard.n_tiles, shard.seed, start_idx, max_threads)
+            for shard, _, _, _, _, start_idx, max_threads in starmap_args[1]
+        ] == [(2, 7, 0, 2), (1, 8, 2, 2)]
+        for _, slide_, mask, mask_true_idx, mask_integral, _, _ in starmap_args[1]:
+            assert slide_ is slide
+            assert mask is NpArrayMock.ONES_500X500_BOOL
+            assert mask_true_idx is None
+            np.testing.assert_array_equal(
+                mask_integral, RandomTiler._mask_integral(mask)
+            )
+        assert re.sub(r":+\d{3}", "", caplog.text).splitlines() == [
+            "DEBUG    tiler:tiler.py \t Tile 0 saved: tile_0.png",
+            "DEBUG    tiler:tiler.py \t Tile 1 saved: tile_1.png",
+            "DEBUG    tiler:tiler.py \t Tile 2 saved: tile_2.png",
+            "INFO     tiler:tiler.py 3 Random Tiles have been saved.",
+        ]
+
+    def but_it_extracts_the_tiles_in_process_with_a_single_available_cpu(
+        self, request, tmpdir
+    ):
+        slide, _ = base_test_slide(tmpdir, PILIMG.RGBA_COLOR_500X500_155_249_240)
+        _box_mask_thumb = method_mock(request, BiggestTissueBoxMask, "__call__")
+        _box_mask_thumb.return_value = NpArrayMock.ONES_500X500_BOOL
+        _available_cpus = method_mock(request, RandomTiler, "_available_cpus")
+        _available_cpus.return_value = 1
+        _save_tiles = method_mock(request, RandomTiler, "_save_tiles")
+        _save_tiles.return_value = iter([(0, "tile_0.png")])
+        _get_context = function_mock(
+            request, "histolab.tiler.multiprocessing.get_context"
+        )
+        random_tiler = RandomTiler((10, 10), n_tiles=3, level=0, check_tissue=False)
+
+        random_tiler.extract(slide, BiggestTissueBoxMask(), n_workers=None)
+
+        _save_tiles.assert_called_once_with(
+            random_tiler, slide, NpArrayMock.ONES_500X500_BOOL, None, None, 0, 1
+        )
+        _get_context.assert_not_called()
+
+    def it_returns_the_tiles_saved_by_a_shard(self, request):
+        _save_tiles = method_mock(request, RandomTiler, "_save_tiles")
+        _save_tiles.return_value = iter([(4, "tile_4.png"), (5, "tile_5.png")])
+        random_tiler = RandomTiler((10, 10), n_tiles=2, level=0)
+        slide = instance_mock(request, Slide)
+
+        saved_tiles = random_tiler._extract_shard(
+            slide, COMPLEX_MASK4, None, None, 4, 2
+        )
+
+        assert saved_tiles == [(4, "tile_4.png"), (5, "tile_5.png")]
+        _save_tiles.assert_called_once_with(
+            random_tiler, slide, COMPLEX_MASK4, None, None, 4, 2
+        )
+
+    @pytest.mark.parametrize(
+        "n_tiles, max_iter, seed, n_workers, expected_shards",
+        (
+            (10, 10, 7, 3, [(4, 4, 7, 0), (3, 3, 8, 4), (3, 3, 9, 7)]),
+            (
+                3,
+                100,
+                2**32 - 1,
+                4,
+                [(1, 34, 2**32 - 1, 0), (1, 33, 0, 1), (1, 33, 1, 2)],
+            ),
+            (5, 6, 0, 2, [(3, 3, 0, 0), (2, 3, 1, 3)]),
+            (0, 0, 7, 2, [(0, 0, 7, 0)]),
+        ),
+    )
+    def it_knows_its_shards(self, n_tiles, max_iter, seed, n_workers, expected_shards):
+        random_tiler = RandomTiler((10, 10), n_tiles, seed=seed, max_iter=max_iter)
+
+        shards = random_tiler._shards(n_workers)
+
+        assert [
+            (shard.n_tiles, shard.max_iter, shard.seed, start_idx)
+            for shard, start_idx in shards
+        ] == expected_shards
+        assert all(shard.tile_size == (10, 10) for shard, _ in shards)
+        assert random_tiler.n_tiles == n_tiles
 
     @pytest.mark.parametrize(
         "image, size",
@@ -405,8 +1018,14 @@ class Describe_RandomTiler:
     # fixture components ---------------------------------------------
 
     @pytest.fixture
-    def _random_tile_coordinates(self, request):
-        return method_mock(request, RandomTiler, "_random_tile_coordinates")
+    def _random_tiles_wsi_coordinates(self, request):
+        _random_tiles_wsi_coordinates = method_mock(
+            request, RandomTiler, "_random_tiles_wsi_coordinates"
+        )
+        _random_tiles_wsi_coordinates.return_value = iter(
+            [np.array([0, 0, 10, 10])] * 10
+        )
+        return _random_tiles_wsi_coordinates
 
 
 class Describe_GridTiler:
@@ -562,6 +1181,8 @@ class Describe_GridTiler:
         expected_n_tiles,
     ):
         slide, _ = base_test_slide(tmpdir, PILIMG.RGBA_COLOR_500X500_155_249_240)
+        _box_mask_thumb = method_mock(request, BiggestTissueBoxMask, "__call__")
+        _box_mask_thumb.return_value = NpArrayMock.ONES_500X500_BOOL
         _extract_tile = method_mock(request, Slide, "extract_tile")
         _has_enough_tissue = method_mock(request, Tile, "has_enough_tissue")
         _has_enough_tissue.side_effect = has_enough_tissue
@@ -618,6 +1239,8 @@ class Describe_GridTiler:
         expected_n_tiles,
     ):
         slide, _ = base_test_slide(tmpdir, PILIMG.RGBA_COLOR_500X500_155_249_240)
+        _box_mask_thumb = method_mock(request, BiggestTissueBoxMask, "__call__")
+        _box_mask_thumb.return_value = NpArrayMock.ONES_500X500_BOOL
         _extract_tile = method_mock(request, Slide, "extract_tile")
         _has_enough_tissue = method_mock(request, Tile, "has_enough_tissue")
         _has_enough_tissue.side_effect = has_enough_tissue
@@ -6,6 +6,7 @@ import operator
 from collections import namedtuple
 
 import numpy as np
+import PIL
 import pytest
 from histolab.types import CP, Region
 from histolab.util import (
@@ -18,6 +19,7 @@ from histolab.util import (
     region_coordinates,
     regions_from_binary_mask,
     regions_to_binary_mask,
+    resize_mask,
     scale_coordinates,
     threshold_to_mask,
 )
@@ -190,6 +192,65 @@ def test_random_choice_true_mask2d(seed):
     assert COMPLEX_MASK[row, col]
 
 
+@pytest.mark.parametrize(
+    "binary_mask, expected_value",
+    (
+        (np.array([[False, False], [False, True]]), (1, 1)),
+        (np.array([[False, True, False]]), (1, 0)),
+    ),
+)
+def test_random_choice_true_mask2d_with_a_single_true_location(
+    binary_mask, expected_value
+):
+    col, row = random_choice_true_mask2d(binary_mask)
+
+    assert (col, row) == expected_value
+
+
+def test_random_choice_true_mask2d_can_pick_every_true_location():
+    np.random.seed(0)
+    binary_mask = np.array([[True, False], [False, True]])
+
+    locations = {random_choice_true_mask2d(binary_mask) for _ in range(100)}
+
+    assert locations == {(0, 0), (1, 1)}
+
+
+@pytest.mark.parametrize(
+    "binary_mask, target_dims, expected_value",
+    (
+        (
+            np.array([[True, False], [False, True]]),
+            (4, 2),
+            np.array([[True, True, False, False], [False, False, True, True]]),
+        ),
+        (
+            np.array([[True, False, False], [False, False, True]]),
+            (2, 1),
+            np.array([[False, True]]),
+        ),
+        (np.array([[True, False, True]]), (3, 1), np.array([[True, False, True]])),
+    ),
+)
+def test_resize_mask(binary_mask, target_dims, expected_value):
+    resized_mask = resize_mask(binary_mask, target_dims)
+
+    assert resized_mask.dtype == bool
+    np.testing.assert_array_equal(resized_mask, expected_value)
+
+
+@pytest.mark.parametrize("target_dims", ((33, 41), (170, 120), (1234, 987), (7, 1)))
+def test_resize_mask_as_pil_nearest_resampling(target_dims):
+    resized_mask = resize_mask(COMPLEX_MASK, target_dims)
+
+    np.testing.assert_array_equal(
+        resized_mask,
+        np.array(
+            PIL.Image.fromarray(COMPLEX_MASK).resize(target_dims, PIL.Image.NEAREST)
+        ),
+    )
+
+
 def test_regions_to_binary_mask():
     regions = [
         Region(